@@ -8,16 +8,35 @@ Usage:
     streamlit run app/app.py
 """
 
+import heapq
 import os
-import json
+import re
+from bisect import bisect_right
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Dict, Optional
+from html import escape
+from typing import Any, Dict, Iterator, Optional
 
+import orjson
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Configuration
 API_URL = os.environ.get("API_URL", "http://127.0.0.1:8000")
+HEALTH_TIMEOUT = (0.3, 0.5)  # (connect, read) seconds
+# Assessment POSTs running at once across all sessions; more are queued
+ASSESSMENT_WORKERS = int(os.environ.get("ASSESSMENT_WORKERS", "32"))
+MAX_FINDINGS = 8
+POLL_INTERVAL = 0.25  # seconds between checks on a running assessment
+
+# Intake fields whose values come from multiselects (order is not meaningful)
+MULTISELECT_FIELDS = ("user_types", "data_types", "decision_impacts")
+
+# Session state written when an assessment completes; cleared by New Assessment
+RESULT_STATE_KEYS = ("result", "result_ts", "report_bytes")
 
 # Page config
 st.set_page_config(
@@ -27,522 +46,237 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
-# Modern, clean CSS - White background with floating cards
-st.markdown("""
-<style>
-    /* Import clean font */
-    @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
-
-    /* Reset and base styles */
-    * {
-        font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-    }
-
-    /* Main app background - Clean white */
-    .stApp {
-        background: #FFFFFF;
-    }
-
-    /* Main container */
-    .main .block-container {
-        max-width: 900px;
-        padding: 2rem 2rem;
-        margin: 0 auto;
-    }
-
-    /* Hide Streamlit branding */
-    #MainMenu {visibility: hidden;}
-    footer {visibility: hidden;}
-    header {visibility: hidden;}
-    .stDeployButton {visibility: hidden;}
-
-    /* Typography */
-    h1 {
-        color: #1a1a1a !important;
-        font-weight: 600 !important;
-        font-size: 1.75rem !important;
-        margin-bottom: 0.25rem !important;
-        letter-spacing: -0.02em !important;
-    }
-
-    h2 {
-        color: #1a1a1a !important;
-        font-weight: 600 !important;
-        font-size: 1rem !important;
-        margin-top: 1.5rem !important;
-        margin-bottom: 0.75rem !important;
-    }
-
-    h3 {
-        color: #1a1a1a !important;
-        font-weight: 600 !important;
-        font-size: 0.875rem !important;
-        margin-top: 1rem !important;
-        margin-bottom: 0.5rem !important;
-    }
-
-    /* Subtitle styling */
-    .subtitle {
-        color: #666666 !important;
-        font-size: 0.9375rem !important;
-        font-weight: 400 !important;
-        margin-bottom: 1.5rem !important;
-    }
-
-    /* Top nav bar */
-    .nav-bar {
-        display: flex;
-        align-items: center;
-        justify-content: space-between;
-        padding: 1rem 0;
-        border-bottom: 1px solid #e5e5e5;
-        margin-bottom: 2rem;
-    }
-
-    .nav-title {
-        font-size: 1.125rem;
-        font-weight: 600;
-        color: #1a1a1a;
-    }
-
-    /* Status badge */
-    .status-badge {
-        display: inline-flex;
-        align-items: center;
-        gap: 0.5rem;
-        background: #FFFFFF;
-        color: #666666;
-        padding: 0.375rem 0.75rem;
-        border-radius: 6px;
-        font-size: 0.75rem;
-        font-weight: 500;
-        border: 1px solid #e5e5e5;
-    }
-
-    .status-dot {
-        width: 6px;
-        height: 6px;
-        background: #22c55e;
-        border-radius: 50%;
-    }
-
-    .status-offline .status-dot {
-        background: #ef4444;
-    }
-
-    /* Floating card styles */
-    .card {
-        background: #FFFFFF;
-        border: 1px solid #e5e5e5;
-        border-radius: 12px;
-        padding: 1.5rem;
-        margin-bottom: 1rem;
-        box-shadow: 0 1px 3px rgba(0,0,0,0.08);
-    }
-
-    .card-header {
-        font-size: 0.875rem;
-        font-weight: 600;
-        color: #1a1a1a;
-        margin-bottom: 1rem;
-        padding-bottom: 0.75rem;
-        border-bottom: 1px solid #f0f0f0;
-    }
-
-    /* Form styling */
-    .stTextInput > div > div > input,
-    .stTextArea > div > div > textarea,
-    .stSelectbox > div > div,
-    .stMultiSelect > div > div {
-        background: #FFFFFF !important;
-        border: 1px solid #e5e5e5 !important;
-        border-radius: 8px !important;
-        color: #1a1a1a !important;
-        font-size: 0.875rem !important;
-        padding: 0.625rem 0.875rem !important;
-        transition: all 0.15s ease !important;
-    }
-
-    .stTextInput > div > div > input:focus,
-    .stTextArea > div > div > textarea:focus {
-        border-color: #3b82f6 !important;
-        box-shadow: 0 0 0 3px rgba(59, 130, 246, 0.1) !important;
-    }
-
-    .stTextInput > div > div > input::placeholder,
-    .stTextArea > div > div > textarea::placeholder {
-        color: #9ca3af !important;
-    }
-
-    /* Labels */
-    .stTextInput > label,
-    .stTextArea > label,
-    .stSelectbox > label,
-    .stMultiSelect > label,
-    .stRadio > label,
-    .stCheckbox > label {
-        color: #374151 !important;
-        font-weight: 500 !important;
-        font-size: 0.8125rem !important;
-        margin-bottom: 0.375rem !important;
-    }
-
-    /* Radio buttons */
-    .stRadio > div {
-        gap: 0.375rem;
-    }
-
-    .stRadio > div > label {
-        background: #FFFFFF !important;
-        border: 1px solid #e5e5e5 !important;
-        border-radius: 8px !important;
-        padding: 0.625rem 0.875rem !important;
-        margin: 0.125rem 0 !important;
-        color: #374151 !important;
-        font-size: 0.8125rem !important;
-        transition: all 0.15s ease !important;
-    }
-
-    .stRadio > div > label:hover {
-        background: #f9fafb !important;
-        border-color: #3b82f6 !important;
-    }
-
-    /* Checkboxes */
-    .stCheckbox {
-        margin-top: 0.375rem;
-    }
-
-    .stCheckbox > label {
-        color: #374151 !important;
-        font-weight: 400 !important;
-        font-size: 0.8125rem !important;
-    }
-
-    /* Primary button */
-    .stButton > button {
-        background: #3b82f6 !important;
-        color: #FFFFFF !important;
-        border: none !important;
-        border-radius: 8px !important;
-        padding: 0.625rem 1.25rem !important;
-        font-weight: 500 !important;
-        font-size: 0.875rem !important;
-        transition: all 0.15s ease !important;
-        box-shadow: 0 1px 2px rgba(0,0,0,0.05) !important;
-    }
-
-    .stButton > button:hover {
-        background: #2563eb !important;
-        box-shadow: 0 2px 4px rgba(59, 130, 246, 0.2) !important;
-    }
-
-    /* Download button */
-    .stDownloadButton > button {
-        background: #FFFFFF !important;
-        color: #374151 !important;
-        border: 1px solid #e5e5e5 !important;
-        border-radius: 8px !important;
-        padding: 0.625rem 1.25rem !important;
-        font-weight: 500 !important;
-        font-size: 0.875rem !important;
-        transition: all 0.15s ease !important;
-    }
-
-    .stDownloadButton > button:hover {
-        background: #f9fafb !important;
-        border-color: #3b82f6 !important;
-        color: #3b82f6 !important;
-    }
-
-    /* Score display */
-    .score-container {
-        background: #FFFFFF;
-        border: 1px solid #e5e5e5;
-        border-radius: 12px;
-        padding: 2rem 1.5rem;
-        text-align: center;
-        margin: 1.5rem 0;
-        box-shadow: 0 1px 3px rgba(0,0,0,0.08);
-    }
-
-    .score-value {
-        font-size: 3rem;
-        font-weight: 700;
-        line-height: 1;
-        margin-bottom: 0.75rem;
-        color: #3b82f6;
-    }
-
-    .score-value.high-risk {
-        color: #ef4444;
-    }
-
-    .score-value.medium-risk {
-        color: #f59e0b;
-    }
-
-    .score-value.low-risk {
-        color: #22c55e;
-    }
-
-    .score-label {
-        display: inline-block;
-        padding: 0.375rem 1rem;
-        border-radius: 6px;
-        font-size: 0.75rem;
-        font-weight: 600;
-        text-transform: uppercase;
-        letter-spacing: 0.05em;
-    }
-
-    .label-high {
-        background: #fef2f2;
-        color: #dc2626;
-    }
-
-    .label-medium {
-        background: #fffbeb;
-        color: #d97706;
-    }
-
-    .label-low {
-        background: #f0fdf4;
-        color: #16a34a;
-    }
-
-    /* Summary box */
-    .summary-box {
-        background: #f9fafb;
-        border: 1px solid #e5e5e5;
-        border-radius: 8px;
-        padding: 1rem 1.25rem;
-        color: #374151;
-        font-size: 0.875rem;
-        line-height: 1.6;
-        margin: 1rem 0;
-    }
-
-    /* Violation cards */
-    .violation-card {
-        background: #FFFFFF;
-        border: 1px solid #e5e5e5;
-        border-radius: 8px;
-        padding: 1rem 1.25rem;
-        margin-bottom: 0.75rem;
-        display: flex;
-        align-items: flex-start;
-        gap: 1rem;
-        transition: all 0.15s ease;
-    }
-
-    .violation-card:hover {
-        box-shadow: 0 2px 6px rgba(0, 0, 0, 0.06);
-    }
-
-    .violation-card.high {
-        border-left: 3px solid #ef4444;
-    }
-
-    .violation-card.medium {
-        border-left: 3px solid #f59e0b;
-    }
-
-    .violation-card.low {
-        border-left: 3px solid #22c55e;
-    }
-
-    .violation-content {
-        flex: 1;
-    }
-
-    .violation-title {
-        font-weight: 600;
-        color: #1a1a1a;
-        font-size: 0.875rem;
-        margin-bottom: 0.25rem;
-    }
-
-    .violation-description {
-        color: #666666;
-        font-size: 0.8125rem;
-        line-height: 1.5;
-    }
-
-    .violation-badge {
-        font-size: 0.75rem;
-        font-weight: 600;
-        padding: 0.375rem 0.625rem;
-        border-radius: 6px;
-        white-space: nowrap;
-        min-width: 48px;
-        text-align: center;
-    }
-
-    .badge-high {
-        background: #fef2f2;
-        color: #dc2626;
-    }
-
-    .badge-medium {
-        background: #fffbeb;
-        color: #d97706;
-    }
-
-    .badge-low {
-        background: #f0fdf4;
-        color: #16a34a;
-    }
-
-    /* Action list */
-    .action-list {
-        list-style: none;
-        padding: 0;
-        margin: 0.75rem 0;
-    }
-
-    .action-item {
-        display: flex;
-        align-items: flex-start;
-        gap: 0.75rem;
-        padding: 0.75rem 0;
-        border-bottom: 1px solid #f0f0f0;
-        color: #374151;
-        font-size: 0.8125rem;
-        line-height: 1.5;
-    }
-
-    .action-item:last-child {
-        border-bottom: none;
-    }
-
-    .action-number {
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        width: 1.5rem;
-        height: 1.5rem;
-        background: #3b82f6;
-        color: #FFFFFF;
-        border-radius: 50%;
-        font-size: 0.75rem;
-        font-weight: 600;
-        flex-shrink: 0;
-    }
-
-    /* Divider */
-    hr {
-        border: none;
-        border-top: 1px solid #e5e5e5;
-        margin: 1.5rem 0;
-    }
-
-    /* Form container */
-    [data-testid="stForm"] {
-        background: transparent;
-        border: none;
-        padding: 0;
-    }
-
-    /* Spinner */
-    .stSpinner > div {
-        border-top-color: #3b82f6 !important;
-    }
-
-    /* Info cards */
-    .info-card {
-        background: #f9fafb;
-        border: 1px solid #e5e5e5;
-        border-radius: 8px;
-        padding: 0.75rem 1rem;
-        color: #374151;
-        font-size: 0.8125rem;
-        line-height: 1.5;
-        margin: 0.5rem 0;
-    }
-
-    /* Select dropdown text */
-    [data-baseweb="select"] > div,
-    [data-baseweb="select"] span,
-    .stSelectbox div[data-baseweb="select"] div {
-        color: #1a1a1a !important;
-    }
-
-    /* Multi-select tags */
-    [data-baseweb="tag"] {
-        background-color: #eff6ff !important;
-        color: #1d4ed8 !important;
-    }
-
-    /* Responsive adjustments */
-    @media (max-width: 768px) {
-        .main .block-container {
-            padding: 1.5rem 1rem;
-        }
-
-        h1 {
-            font-size: 1.5rem !important;
-        }
-
-        .score-value {
-            font-size: 2.5rem;
-        }
-
-        .card {
-            padding: 1.25rem;
-        }
-    }
-</style>
-""", unsafe_allow_html=True)
-
+# Inter is loaded with <link> tags rather than a CSS @import, so the font
+# request starts in parallel with the stylesheet instead of blocking it.
+# st.html sanitizes <link> away, so these go through st.markdown.
+FONT_LINKS = """
+<link rel="preconnect" href="https://fonts.googleapis.com">
+<link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+<link rel="stylesheet" href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap">
+"""
 
+# Stylesheet (white background with floating cards), read once by load_css()
+CSS_PATH = os.path.join(os.path.dirname(__file__), "static", "styles.css")
+CSS_COMMENT = re.compile(r"/\*.*?\*/", re.S)
+CSS_WHITESPACE = re.compile(r"\s+")
+# ':' is left alone: "div :hover" and "div:hover" are different selectors
+CSS_PUNCT_SPACE = re.compile(r"\s*([{};,>])\s*")
+
+
+@st.cache_resource
+def load_css() -> str:
+    """Read and minify the app stylesheet once per process."""
+    with open(CSS_PATH, encoding="utf-8") as f:
+        css = f.read()
+    css = CSS_COMMENT.sub("", css)
+    css = CSS_WHITESPACE.sub(" ", css)
+    css = CSS_PUNCT_SPACE.sub(r"\1", css).strip()
+    return f"<style>{css}</style>"
+
+
+def inject_css():
+    """Emit the font links and the app stylesheet."""
+    st.markdown(FONT_LINKS, unsafe_allow_html=True)
+    st.html(load_css())
+
+
+@st.cache_resource
+def get_session() -> requests.Session:
+    """Shared HTTP session so API calls reuse pooled keep-alive connections."""
+    session = requests.Session()
+    # Retry idempotent requests on transient gateway errors (e.g. Cloud Run
+    # cold starts); connection failures and read timeouts are not retried so
+    # an offline or hung API is still reported within the request timeout
+    retries = Retry(total=2, connect=0, read=0, backoff_factor=0.1, status_forcelist=(502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=ASSESSMENT_WORKERS, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_data(ttl=10, show_spinner=False)
 def check_api_health() -> bool:
-    """Check if API is available."""
+    """Check if API is available (cached for 10s across reruns)."""
     try:
-        response = requests.get(f"{API_URL}/health", timeout=5)
+        response = get_session().get(f"{API_URL}/health", timeout=HEALTH_TIMEOUT)
         return response.status_code == 200
-    except:
+    except requests.RequestException:
         return False
 
 
-def assess_intake(intake_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-    """Submit intake form for assessment."""
+def post_assessment(session: requests.Session, payload: bytes) -> Dict[str, Any]:
+    """POST a pre-encoded JSON intake payload to the API (runs on a worker thread)."""
+    response = session.post(
+        f"{API_URL}/assess_intake",
+        data=payload,
+        headers={"Content-Type": "application/json"},
+        timeout=30
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+@st.cache_resource
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Shared worker pool so assessment requests don't block the script thread.
+
+    The pool is process-wide, so ASSESSMENT_WORKERS caps concurrent
+    assessments across all sessions. Requests beyond the cap wait in the
+    queue, and their 30s timeout only starts once a worker picks them up.
+    """
+    return ThreadPoolExecutor(max_workers=ASSESSMENT_WORKERS)
+
+
+@st.cache_resource(show_spinner=False, ttl=3600, max_entries=64)
+def submit_assessment(payload: bytes) -> Future:
+    """
+    Start the assessment POST for a payload on the worker pool.
+
+    The future is cached per payload for an hour, so resubmitting identical
+    answers reuses the finished response instead of hitting the network.
+    Failed futures are evicted by collect_assessment.
+    """
+    return get_executor().submit(post_assessment, get_session(), payload)
+
+
+def encode_intake(intake_data: Dict[str, Any]) -> bytes:
+    """
+    Encode the intake as canonical JSON bytes.
+
+    Keys and multiselect values are sorted, so the same answers always give
+    the same payload (and assessment cache key) regardless of the order the
+    options were picked in.
+    """
+    canonical = dict(intake_data)
+    for field in MULTISELECT_FIELDS:
+        canonical[field] = sorted(canonical[field])
+    return orjson.dumps(canonical, option=orjson.OPT_SORT_KEYS)
+
+
+def collect_assessment(payload: bytes, future: Future) -> Optional[Dict[str, Any]]:
+    """Return a finished assessment, reporting request failures."""
     try:
-        response = requests.post(
-            f"{API_URL}/assess_intake",
-            json=intake_data,
-            timeout=30
-        )
-        if response.status_code == 200:
-            return response.json()
-        else:
-            st.error(f"API Error: {response.status_code}")
-            return None
-    except Exception as e:
+        return future.result()
+    except requests.HTTPError as e:
+        submit_assessment.clear(payload)
+        st.error(f"API Error: {e.response.status_code}")
+        return None
+    except requests.RequestException as e:
+        submit_assessment.clear(payload)
         st.error(f"Connection Error: {str(e)}")
         return None
 
 
-def render_header():
-    """Render the application header."""
-    col1, col2 = st.columns([3, 1])
+def serialize_report(result: Dict[str, Any]) -> bytes:
+    """Encode the assessment result as the downloadable JSON report."""
+    return orjson.dumps(result, option=orjson.OPT_INDENT_2)
 
-    with col1:
-        st.markdown("# AIAudit")
-        st.markdown('<p class="subtitle">EU AI Act Compliance Assessment</p>', unsafe_allow_html=True)
-
-    with col2:
-        api_online = check_api_health()
-        status_class = "status-badge" if api_online else "status-badge status-offline"
-        status_text = "Online" if api_online else "Offline"
-        st.markdown(f'''
+
+def render_header():
+    """Render the application header as a single flex nav bar."""
+    api_online = check_api_health()
+    status_class = "status-badge" if api_online else "status-badge status-offline"
+    status_text = "Online" if api_online else "Offline"
+    st.html(f'''
+    <div class="nav-bar">
+        <div>
+            <h1>AIAudit</h1>
+            <p class="subtitle">EU AI Act Compliance Assessment</p>
+        </div>
         <div class="{status_class}">
             <span class="status-dot"></span>
             <span>{status_text}</span>
         </div>
-        ''', unsafe_allow_html=True)
-
-    st.markdown("---")
+    </div>
+    ''')
+
+
+# Display labels for intake form options
+SECTOR_LABELS: Dict[str, str] = {
+    "hiring": "Hiring / Recruitment",
+    "credit_scoring": "Credit Scoring / Financial",
+    "healthcare": "Healthcare / Medical",
+    "education": "Education",
+    "law_enforcement": "Law Enforcement / Security",
+    "critical_infrastructure": "Critical Infrastructure",
+    "insurance": "Insurance",
+    "social_services": "Social Services / Benefits",
+    "recommender": "Recommendations / Content",
+    "customer_service": "Customer Service",
+    "manufacturing": "Manufacturing / Industrial",
+    "logistics": "Logistics / Supply Chain",
+    "other": "Other",
+}
+
+DATA_TYPE_LABELS: Dict[str, str] = {
+    "biometrics": "Biometric Data",
+    "health_data": "Health / Medical Data",
+    "financial_data": "Financial Data",
+    "criminal_records": "Criminal Records",
+    "political_opinions": "Political Opinions",
+    "religious_beliefs": "Religious Beliefs",
+    "ethnic_origin": "Ethnic Origin",
+    "location_data": "Location Data",
+    "behavioral_data": "Behavioral Data",
+    "employment_data": "Employment Data",
+    "educational_records": "Educational Records",
+    "generic_pii": "Generic Personal Information",
+    "anonymous_data": "Anonymous Data Only",
+}
+
+USER_TYPE_LABELS: Dict[str, str] = {
+    "general_public": "General Public",
+    "employees": "Employees",
+    "children": "Children",
+    "elderly": "Elderly",
+    "vulnerable_groups": "Vulnerable Groups",
+    "patients": "Patients",
+    "students": "Students",
+    "consumers": "Consumers",
+}
+
+DECISION_IMPACT_LABELS: Dict[str, str] = {
+    "employment_decisions": "Employment Decisions",
+    "credit_decisions": "Credit / Loan Decisions",
+    "access_to_services": "Access to Services",
+    "educational_outcomes": "Educational Outcomes",
+    "health_treatment": "Health Treatment",
+    "legal_decisions": "Legal Decisions",
+    "law_enforcement_actions": "Law Enforcement",
+    "safety_critical": "Safety-Critical",
+    "recommendations": "Recommendations Only",
+    "operational_efficiency": "Internal Operations",
+}
+
+OVERSIGHT_LABELS: Dict[str, str] = {
+    "fully_automated": "Fully Automated - No human review",
+    "human_on_the_loop": "Human monitors but system acts autonomously",
+    "human_in_the_loop": "Human reviews before each decision",
+    "human_override_possible": "Human can override any decision",
+    "human_final_decision": "Human makes all final decisions",
+}
+
+
+# Widget options, in display order, shared by every rerun
+SECTOR_OPTIONS = tuple(SECTOR_LABELS)
+DATA_TYPE_OPTIONS = tuple(DATA_TYPE_LABELS)
+USER_TYPE_OPTIONS = tuple(USER_TYPE_LABELS)
+DECISION_IMPACT_OPTIONS = tuple(DECISION_IMPACT_LABELS)
+OVERSIGHT_OPTIONS = tuple(OVERSIGHT_LABELS)
+
+
+@contextmanager
+def card(title: str) -> Iterator[None]:
+    """Wrap a form section in a bordered container with a heading.
+
+    The container key doubles as a ``st-key-card-*`` CSS class, which the
+    stylesheet styles like the ``.card`` divs used elsewhere.
+    """
+    key = "card-" + title.lower().replace(" ", "-")
+    with st.container(border=True, key=key):
+        st.markdown(f"## {title}")
+        yield
 
 
 def render_intake_form() -> Optional[Dict[str, Any]]:
@@ -550,208 +284,85 @@ def render_intake_form() -> Optional[Dict[str, Any]]:
 
     with st.form("assessment_form", clear_on_submit=False):
         # System Information Section
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        st.markdown("## System Information")
-
-        col1, col2 = st.columns(2)
-        with col1:
-            system_name = st.text_input(
-                "AI System Name",
-                value="",
-                placeholder="Enter system name",
-                help="The name of your AI system"
-            )
-        with col2:
-            team_name = st.text_input(
-                "Team / Department",
-                value="Engineering",
-                placeholder="e.g., HR Technology",
-                help="The team responsible for this system"
-            )
-        st.markdown('</div>', unsafe_allow_html=True)
+        with card("System Information"):
+            col1, col2 = st.columns(2)
+            with col1:
+                system_name = st.text_input(
+                    "AI System Name",
+                    value="",
+                    placeholder="Enter system name",
+                    help="The name of your AI system"
+                )
+            with col2:
+                team_name = st.text_input(
+                    "Team / Department",
+                    value="Engineering",
+                    placeholder="e.g., HR Technology",
+                    help="The team responsible for this system"
+                )
 
         # Scope Section
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        st.markdown("## Scope")
-
-        sector = st.selectbox(
-            "What sector does this AI system operate in?",
-            options=[
-                "hiring",
-                "credit_scoring",
-                "healthcare",
-                "education",
-                "law_enforcement",
-                "critical_infrastructure",
-                "insurance",
-                "social_services",
-                "recommender",
-                "customer_service",
-                "manufacturing",
-                "logistics",
-                "other"
-            ],
-            index=0,
-            format_func=lambda x: {
-                "hiring": "Hiring / Recruitment",
-                "credit_scoring": "Credit Scoring / Financial",
-                "healthcare": "Healthcare / Medical",
-                "education": "Education",
-                "law_enforcement": "Law Enforcement / Security",
-                "critical_infrastructure": "Critical Infrastructure",
-                "insurance": "Insurance",
-                "social_services": "Social Services / Benefits",
-                "recommender": "Recommendations / Content",
-                "customer_service": "Customer Service",
-                "manufacturing": "Manufacturing / Industrial",
-                "logistics": "Logistics / Supply Chain",
-                "other": "Other"
-            }.get(x, x)
-        )
+        with card("Scope"):
+            sector = st.selectbox(
+                "What sector does this AI system operate in?",
+                options=SECTOR_OPTIONS,
+                index=0,
+                format_func=SECTOR_LABELS.get
+            )
 
-        use_case = st.text_area(
-            "Describe what your AI system does",
-            value="",
-            placeholder="Briefly describe the purpose and functionality...",
-            height=100,
-            help="Provide details about the system's purpose and decision-making process"
-        )
-        st.markdown('</div>', unsafe_allow_html=True)
+            use_case = st.text_area(
+                "Describe what your AI system does",
+                value="",
+                placeholder="Briefly describe the purpose and functionality...",
+                height=100,
+                help="Provide details about the system's purpose and decision-making process"
+            )
 
         # Data Section
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        st.markdown("## Data Collection")
-
-        data_types = st.multiselect(
-            "What types of data does the system process?",
-            options=[
-                "biometrics",
-                "health_data",
-                "financial_data",
-                "criminal_records",
-                "political_opinions",
-                "religious_beliefs",
-                "ethnic_origin",
-                "location_data",
-                "behavioral_data",
-                "employment_data",
-                "educational_records",
-                "generic_pii",
-                "anonymous_data"
-            ],
-            default=["generic_pii"],
-            format_func=lambda x: {
-                "biometrics": "Biometric Data",
-                "health_data": "Health / Medical Data",
-                "financial_data": "Financial Data",
-                "criminal_records": "Criminal Records",
-                "political_opinions": "Political Opinions",
-                "religious_beliefs": "Religious Beliefs",
-                "ethnic_origin": "Ethnic Origin",
-                "location_data": "Location Data",
-                "behavioral_data": "Behavioral Data",
-                "employment_data": "Employment Data",
-                "educational_records": "Educational Records",
-                "generic_pii": "Generic Personal Information",
-                "anonymous_data": "Anonymous Data Only"
-            }.get(x, x),
-            help="Select all data types that apply"
-        )
-        st.markdown('</div>', unsafe_allow_html=True)
-
-        # Impact Section
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        st.markdown("## Impact Assessment")
-
-        col1, col2 = st.columns(2)
-
-        with col1:
-            user_types = st.multiselect(
-                "Who are the affected users?",
-                options=[
-                    "general_public",
-                    "employees",
-                    "children",
-                    "elderly",
-                    "vulnerable_groups",
-                    "patients",
-                    "students",
-                    "consumers"
-                ],
-                default=["employees"],
-                format_func=lambda x: {
-                    "general_public": "General Public",
-                    "employees": "Employees",
-                    "children": "Children",
-                    "elderly": "Elderly",
-                    "vulnerable_groups": "Vulnerable Groups",
-                    "patients": "Patients",
-                    "students": "Students",
-                    "consumers": "Consumers"
-                }.get(x, x)
+        with card("Data Collection"):
+            data_types = st.multiselect(
+                "What types of data does the system process?",
+                options=DATA_TYPE_OPTIONS,
+                default=["generic_pii"],
+                format_func=DATA_TYPE_LABELS.get,
+                help="Select all data types that apply"
             )
 
-        with col2:
-            decision_impacts = st.multiselect(
-                "What decisions does the system influence?",
-                options=[
-                    "employment_decisions",
-                    "credit_decisions",
-                    "access_to_services",
-                    "educational_outcomes",
-                    "health_treatment",
-                    "legal_decisions",
-                    "law_enforcement_actions",
-                    "safety_critical",
-                    "recommendations",
-                    "operational_efficiency"
-                ],
-                default=["employment_decisions"],
-                format_func=lambda x: {
-                    "employment_decisions": "Employment Decisions",
-                    "credit_decisions": "Credit / Loan Decisions",
-                    "access_to_services": "Access to Services",
-                    "educational_outcomes": "Educational Outcomes",
-                    "health_treatment": "Health Treatment",
-                    "legal_decisions": "Legal Decisions",
-                    "law_enforcement_actions": "Law Enforcement",
-                    "safety_critical": "Safety-Critical",
-                    "recommendations": "Recommendations Only",
-                    "operational_efficiency": "Internal Operations"
-                }.get(x, x)
-            )
-        st.markdown('</div>', unsafe_allow_html=True)
+        # Impact Section
+        with card("Impact Assessment"):
+            col1, col2 = st.columns(2)
+
+            with col1:
+                user_types = st.multiselect(
+                    "Who are the affected users?",
+                    options=USER_TYPE_OPTIONS,
+                    default=["employees"],
+                    format_func=USER_TYPE_LABELS.get
+                )
+
+            with col2:
+                decision_impacts = st.multiselect(
+                    "What decisions does the system influence?",
+                    options=DECISION_IMPACT_OPTIONS,
+                    default=["employment_decisions"],
+                    format_func=DECISION_IMPACT_LABELS.get
+                )
 
         # Oversight Section
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        st.markdown("## Human Oversight")
-
-        oversight_level = st.radio(
-            "What level of human oversight exists?",
-            options=[
-                "fully_automated",
-                "human_on_the_loop",
-                "human_in_the_loop",
-                "human_override_possible",
-                "human_final_decision"
-            ],
-            index=2,
-            format_func=lambda x: {
-                "fully_automated": "Fully Automated - No human review",
-                "human_on_the_loop": "Human monitors but system acts autonomously",
-                "human_in_the_loop": "Human reviews before each decision",
-                "human_override_possible": "Human can override any decision",
-                "human_final_decision": "Human makes all final decisions"
-            }.get(x, x),
-            help="Select the level of human involvement in decisions"
-        )
+        with card("Human Oversight"):
+            oversight_level = st.radio(
+                "What level of human oversight exists?",
+                options=OVERSIGHT_OPTIONS,
+                index=2,
+                format_func=OVERSIGHT_LABELS.get,
+                help="Select the level of human involvement in decisions"
+            )
 
-        col1, col2 = st.columns(2)
-        with col1:
-            can_opt_out = st.checkbox("Users can opt out of AI processing", value=True)
-        with col2:
-            has_appeal = st.checkbox("Appeal mechanism exists for decisions", value=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+            col1, col2 = st.columns(2)
+            with col1:
+                can_opt_out = st.checkbox("Users can opt out of AI processing", value=True)
+            with col2:
+                has_appeal = st.checkbox("Appeal mechanism exists for decisions", value=True)
 
         # Submit
         st.markdown("")
@@ -793,6 +404,33 @@ def render_intake_form() -> Optional[Dict[str, Any]]:
     return None
 
 
+# Risk category -> (score class, label class, label text)
+RISK_STYLES = {
+    "high_risk": ("high-risk", "label-high", "HIGH RISK"),
+    "medium_risk": ("medium-risk", "label-medium", "MEDIUM RISK"),
+    "low_risk": ("low-risk", "label-low", "LOW RISK"),
+}
+
+# Factor weight cut-offs: below 0.4 is low, below 0.7 medium, otherwise high
+SEVERITY_THRESHOLDS = (0.4, 0.7)
+SEVERITY_LEVELS = ("low", "medium", "high")
+
+# Violation card markup with the severity classes already filled in
+VIOLATION_CARD_TEMPLATE = """
+<div class="violation-card {severity}">
+    <div class="violation-content">
+        <div class="violation-title">{{article}}</div>
+        <div class="violation-description">{{description}}</div>
+    </div>
+    <span class="violation-badge badge-{severity}">{{score}}%</span>
+</div>
+"""
+VIOLATION_CARDS = {
+    severity: VIOLATION_CARD_TEMPLATE.format(severity=severity)
+    for severity in SEVERITY_LEVELS
+}
+
+
 def render_results(result: Dict[str, Any]):
     """Render the assessment results."""
 
@@ -801,41 +439,36 @@ def render_results(result: Dict[str, Any]):
     risk_category = result.get("risk_category", "medium_risk")
     risk_percentage = int(risk_score * 100)
 
-    if risk_category == "high_risk":
-        score_class = "high-risk"
-        label_class = "label-high"
-        label_text = "HIGH RISK"
-    elif risk_category == "medium_risk":
-        score_class = "medium-risk"
-        label_class = "label-medium"
-        label_text = "MEDIUM RISK"
-    else:
-        score_class = "low-risk"
-        label_class = "label-low"
-        label_text = "LOW RISK"
+    score_class, label_class, label_text = RISK_STYLES.get(risk_category, RISK_STYLES["low_risk"])
 
-    st.markdown(f"""
+    # Static results are assembled into one HTML payload and emitted once;
+    # API-supplied text is escaped so it renders as plain text
+    parts = [f"""
     <div class="score-container">
         <div class="score-value {score_class}">{risk_percentage}</div>
         <span class="score-label {label_class}">{label_text}</span>
     </div>
-    """, unsafe_allow_html=True)
+    """]
 
     # Summary
-    st.markdown('<div class="card">', unsafe_allow_html=True)
-    st.markdown("## Executive Summary")
     summary = result.get("executive_summary", "Assessment complete.")
-    st.markdown(f'<div class="summary-box">{summary}</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+    parts.append(f"""
+    <div class="card">
+        <h2>Executive Summary</h2>
+        <div class="summary-box">{escape(summary)}</div>
+    </div>
+    """)
 
     # Article Violations
-    st.markdown('<div class="card">', unsafe_allow_html=True)
-    st.markdown("## EU AI Act Article Analysis")
+    parts.append('<div class="card"><h2>EU AI Act Article Analysis</h2>')
 
     risk_factors = result.get("risk_factors", [])
     obligations = result.get("obligations", [])
 
-    findings = []
+    # Findings are bucketed by severity as they are built. Each one is a
+    # (-score, position, severity, article, description) tuple, so plain
+    # tuple ordering ranks a bucket by score and keeps insertion order on ties
+    buckets = {"high": [], "medium": [], "low": []}
 
     for factor in risk_factors:
         weight = factor.get("weight", 0)
@@ -844,106 +477,146 @@ def render_results(result: Dict[str, Any]):
         article_ref = factor.get("article_reference", "")
         description = factor.get("description", "")
 
-        if weight >= 0.7:
-            severity = "high"
-        elif weight >= 0.4:
-            severity = "medium"
-        else:
-            severity = "low"
-
-        findings.append({
-            "article": article_ref,
-            "description": description,
-            "severity": severity,
-            "score": int(weight * 100)
-        })
+        severity = SEVERITY_LEVELS[bisect_right(SEVERITY_THRESHOLDS, weight)]
+        bucket = buckets[severity]
+        bucket.append((-int(weight * 100), len(bucket), severity, article_ref, description))
 
+    high = buckets["high"]
     for ob in obligations:
         if ob.get("priority") == "high":
-            findings.append({
-                "article": ob.get("article_reference", ""),
-                "description": f"{ob.get('title', '')}: {ob.get('description', '')}",
-                "severity": "high",
-                "score": 80
-            })
-
-    severity_order = {"high": 0, "medium": 1, "low": 2}
-    findings.sort(key=lambda x: (severity_order.get(x["severity"], 2), -x["score"]))
+            high.append((
+                -80,
+                len(high),
+                "high",
+                ob.get("article_reference", ""),
+                f"{ob.get('title', '')}: {ob.get('description', '')}"
+            ))
+
+    # Take the top findings bucket by bucket; lower buckets are never ranked
+    # once the higher-severity ones fill the display
+    findings = []
+    for bucket in (buckets["high"], buckets["medium"], buckets["low"]):
+        remaining = MAX_FINDINGS - len(findings)
+        if remaining <= 0:
+            break
+        findings.extend(heapq.nsmallest(remaining, bucket))
 
     if findings:
-        for finding in findings[:8]:
-            severity = finding["severity"]
-            st.markdown(f"""
-            <div class="violation-card {severity}">
-                <div class="violation-content">
-                    <div class="violation-title">{finding["article"]}</div>
-                    <div class="violation-description">{finding["description"]}</div>
-                </div>
-                <span class="violation-badge badge-{severity}">{finding["score"]}%</span>
-            </div>
-            """, unsafe_allow_html=True)
+        for neg_score, _, severity, article, description in findings:
+            parts.append(VIOLATION_CARDS[severity].format(
+                article=escape(article),
+                description=escape(description),
+                score=-neg_score
+            ))
     else:
-        st.markdown('<div class="info-card">No specific article violations identified.</div>', unsafe_allow_html=True)
-    st.markdown('</div>', unsafe_allow_html=True)
+        parts.append('<div class="info-card">No specific article violations identified.</div>')
+    parts.append('</div>')
 
     # Required Actions
     recommendations = result.get("key_recommendations", [])
     if recommendations:
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        st.markdown("## Required Actions")
-
-        actions_html = '<div class="action-list">'
-        for i, rec in enumerate(recommendations, 1):
-            actions_html += f'''
-            <div class="action-item">
-                <span class="action-number">{i}</span>
-                <span>{rec}</span>
-            </div>
-            '''
-        actions_html += '</div>'
-
-        st.markdown(actions_html, unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+        parts.append('<div class="card"><h2>Required Actions</h2><div class="action-list">')
+        parts.append("".join(
+            f'<div class="action-item"><span class="action-number">{i}</span><span>{escape(rec)}</span></div>'
+            for i, rec in enumerate(recommendations, 1)
+        ))
+        parts.append('</div></div>')
 
     # Documentation Gaps
     gaps = result.get("documentation_gaps", [])
     if gaps:
-        st.markdown('<div class="card">', unsafe_allow_html=True)
-        st.markdown("## Missing Documentation")
-        for gap in gaps:
-            st.markdown(f'<div class="info-card">{gap}</div>', unsafe_allow_html=True)
-        st.markdown('</div>', unsafe_allow_html=True)
+        parts.append('<div class="card"><h2>Missing Documentation</h2>')
+        parts.append("".join(f'<div class="info-card">{escape(gap)}</div>' for gap in gaps))
+        parts.append('</div>')
+
+    # Divider above the action buttons
+    parts.append('<hr>')
+
+    st.html("".join(parts))
 
     # Actions
-    st.markdown("---")
 
     col1, col2, col3 = st.columns([1, 1, 1])
 
     with col1:
         st.download_button(
             "Download Report",
-            json.dumps(result, indent=2),
-            f"ai_audit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            st.session_state.report_bytes,
+            f"ai_audit_{st.session_state.result_ts}.json",
             "application/json",
+            on_click="ignore",
             use_container_width=True
         )
 
     with col3:
         if st.button("New Assessment", use_container_width=True):
+            for key in RESULT_STATE_KEYS:
+                st.session_state.pop(key, None)
+            check_api_health.clear()
             st.rerun()
 
 
+# Placeholder results layout rendered while the assessment request runs
+PENDING_HTML = """
+<div class="score-container">
+    <div class="skeleton skeleton-score"></div>
+    <span class="score-label">Analyzing compliance...</span>
+</div>
+<div class="card">
+    <h2>Executive Summary</h2>
+    <div class="skeleton skeleton-line" style="width: 90%;"></div>
+    <div class="skeleton skeleton-line" style="width: 75%;"></div>
+    <div class="skeleton skeleton-line" style="width: 60%;"></div>
+</div>
+"""
+
+
+def render_pending(future: Future):
+    """Show a results skeleton for a running assessment and poll until it finishes."""
+    st.html(PENDING_HTML)
+    if st.button("Cancel", use_container_width=True):
+        # Only stop waiting: the cached future may be shared with other
+        # sessions that submitted the same answers, so it is not cancelled
+        st.session_state.pop("pending_payload", None)
+        st.rerun()
+
+    # Wait briefly, then rerun so the Cancel button stays responsive
+    wait([future], timeout=POLL_INTERVAL)
+    st.rerun()
+
+
 def main():
     """Main application."""
+    inject_css()
     render_header()
 
+    # Once an assessment exists only the results are rendered, so reruns
+    # triggered by the result widgets skip rebuilding the intake form
+    if "result" in st.session_state:
+        render_results(st.session_state.result)
+        return
+
+    # The POST runs on a worker thread; each rerun polls it until it is done
+    payload = st.session_state.get("pending_payload")
+    if payload is not None:
+        future = submit_assessment(payload)
+        if not future.done():
+            render_pending(future)
+        del st.session_state["pending_payload"]
+        result = collect_assessment(payload, future)
+        if result:
+            st.session_state.result = result
+            st.session_state.result_ts = datetime.now().strftime('%Y%m%d_%H%M%S')
+            st.session_state.report_bytes = serialize_report(result)
+            st.rerun()
+
     intake_data = render_intake_form()
 
     if intake_data:
-        with st.spinner("Analyzing compliance..."):
-            result = assess_intake(intake_data)
-            if result:
-                render_results(result)
+        payload = encode_intake(intake_data)
+        submit_assessment(payload)
+        st.session_state.pending_payload = payload
+        st.rerun()
 
 
 if __name__ == "__main__":
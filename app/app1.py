@@ -8,12 +8,16 @@ import os
 import json
 import random
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import requests
 import streamlit as st
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 API_URL = os.environ.get("API_URL", "http://127.0.0.1:8000")
+HEALTH_TIMEOUT = (0.3, 0.5)  # (connect, read) seconds
+RESULT_STATE_KEYS = ("result", "result_key")
 
 st.set_page_config(
     page_title="AIAudit - EU AI Act Compliance",
@@ -31,13 +35,8 @@ GRADIENTS = [
     "linear-gradient(135deg, #ecfeff 0%, #cffafe 30%, #ffffff 100%)",  # Cyan
 ]
 
-if 'gradient' not in st.session_state:
-    st.session_state.gradient = random.choice(GRADIENTS)
-
-gradient = st.session_state.gradient
-
-# Beautiful CSS with animations and polish
-st.markdown(f"""
+# Beautiful CSS with animations and polish; {gradient} is the page background
+CSS_TEMPLATE = """
 <style>
 @import url('https://fonts.googleapis.com/css2?family=Barlow:wght@400;500;600;700;800;900&display=swap');
 
@@ -342,26 +341,53 @@ hr, .stMarkdown hr {{
     background: #a1a1a1;
 }}
 </style>
-""", unsafe_allow_html=True)
+"""
+
+
+@st.cache_resource
+def build_css(gradient: str) -> str:
+    """Fill the stylesheet template once per gradient."""
+    return CSS_TEMPLATE.format(gradient=gradient)
+
 
+gradient = st.session_state.setdefault('gradient', random.choice(GRADIENTS))
 
+st.markdown(build_css(gradient), unsafe_allow_html=True)
+
+
+@st.cache_resource
+def get_session() -> requests.Session:
+    """Shared HTTP session so API calls reuse pooled keep-alive connections."""
+    session = requests.Session()
+    # Retry idempotent requests on transient gateway errors; connection
+    # failures and read timeouts are not retried so an offline or hung API
+    # is still reported within the request timeout
+    retries = Retry(total=2, connect=0, read=0, backoff_factor=0.1, status_forcelist=(502, 503, 504))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_data(ttl=10, show_spinner=False)
 def check_api_health() -> bool:
+    """Check if API is available (cached for 10s across reruns)."""
     try:
-        response = requests.get(f"{API_URL}/health", timeout=5)
+        response = get_session().get(f"{API_URL}/health", timeout=HEALTH_TIMEOUT)
         return response.status_code == 200
-    except:
+    except requests.RequestException:
         return False
 
 
 def assess_intake(intake_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     try:
-        response = requests.post(f"{API_URL}/assess_intake", json=intake_data, timeout=30)
+        response = get_session().post(f"{API_URL}/assess_intake", json=intake_data, timeout=30)
         if response.status_code == 200:
             return response.json()
         else:
             st.error(f"API Error: {response.status_code}")
             return None
-    except Exception as e:
+    except requests.RequestException as e:
         st.error(f"Connection Error: {str(e)}")
         return None
 
@@ -415,11 +441,7 @@ SECTION_ICONS = {
 }
 
 
-def render_section_card(title: str, icon_key: str, color: str):
-    """Render a beautiful section card header with SVG icon."""
-    icon_svg = SECTION_ICONS.get(icon_key, SECTION_ICONS["system"])
-
-    st.markdown(f"""
+SECTION_CARD_TEMPLATE = """
     <div style="
         background: white;
         border-radius: 16px;
@@ -444,78 +466,134 @@ def render_section_card(title: str, icon_key: str, color: str):
         ">{icon_svg}</div>
         <span style="font-family: 'Barlow', sans-serif; font-size: 18px; font-weight: 700; color: #1a1a1a; letter-spacing: -0.3px;">{title}</span>
     </div>
-    """, unsafe_allow_html=True)
+"""
+
+
+def build_section_card(title: str, icon_key: str, color: str) -> str:
+    """Build a section card header with SVG icon."""
+    icon_svg = SECTION_ICONS.get(icon_key, SECTION_ICONS["system"])
+    return SECTION_CARD_TEMPLATE.format(title=title, icon_svg=icon_svg, color=color)
+
+
+# Intake form section headers, rendered once at import
+SECTION_CARDS = {
+    "system": build_section_card("System Information", "system", "#8b5cf6"),
+    "scope": build_section_card("Scope & Purpose", "scope", "#22c55e"),
+    "data": build_section_card("Data Processing", "data", "#3b82f6"),
+    "impact": build_section_card("Impact Assessment", "impact", "#f59e0b"),
+    "oversight": build_section_card("Human Oversight", "oversight", "#ec4899"),
+}
+
+
+def render_section_card(section: str):
+    """Render a beautiful section card header."""
+    st.markdown(SECTION_CARDS[section], unsafe_allow_html=True)
+
+
+# Display labels for intake form options
+SECTOR_LABELS: Dict[str, str] = {
+    "hiring": "Hiring / Recruitment",
+    "credit_scoring": "Credit Scoring / Financial",
+    "healthcare": "Healthcare / Medical",
+    "education": "Education",
+    "law_enforcement": "Law Enforcement / Security",
+    "critical_infrastructure": "Critical Infrastructure",
+    "insurance": "Insurance",
+    "social_services": "Social Services / Benefits",
+    "recommender": "Recommendations / Content",
+    "customer_service": "Customer Service",
+    "manufacturing": "Manufacturing / Industrial",
+    "logistics": "Logistics / Supply Chain",
+    "other": "Other",
+}
+
+OVERSIGHT_LABELS: Dict[str, str] = {
+    "fully_automated": "Fully Automated — No human review",
+    "human_on_the_loop": "Human Monitoring — System acts autonomously",
+    "human_in_the_loop": "Human Review — Each decision reviewed",
+    "human_override_possible": "Human Override — Can intervene anytime",
+    "human_final_decision": "Human Final — All decisions by humans",
+}
+
+# Widget options, in display order, shared by every rerun
+SECTOR_OPTIONS = tuple(SECTOR_LABELS)
+OVERSIGHT_OPTIONS = tuple(OVERSIGHT_LABELS)
+DATA_TYPE_OPTIONS = (
+    "biometrics", "health_data", "financial_data", "criminal_records",
+    "political_opinions", "religious_beliefs", "ethnic_origin", "location_data",
+    "behavioral_data", "employment_data", "educational_records", "generic_pii", "anonymous_data",
+)
+USER_TYPE_OPTIONS = (
+    "general_public", "employees", "children", "elderly", "vulnerable_groups", "patients", "students", "consumers",
+)
+DECISION_IMPACT_OPTIONS = (
+    "employment_decisions", "credit_decisions", "access_to_services", "educational_outcomes",
+    "health_treatment", "legal_decisions", "law_enforcement_actions", "safety_critical",
+    "recommendations", "operational_efficiency",
+)
+
+# No documentation artifacts are collected by the form; all start as not_started
+DOCUMENTATION_KEYS = (
+    "data_sheet", "model_card", "system_logs", "monitoring_dashboard",
+    "risk_assessment", "bias_audit", "technical_documentation", "user_instructions",
+)
+DEFAULT_DOCUMENTATION = dict.fromkeys(DOCUMENTATION_KEYS, "not_started")
+
+# Title-cased labels for the multiselect options, computed once at import
+DATA_TYPE_LABELS = {o: o.replace("_", " ").title() for o in DATA_TYPE_OPTIONS}
+USER_TYPE_LABELS = {o: o.replace("_", " ").title() for o in USER_TYPE_OPTIONS}
+DECISION_IMPACT_LABELS = {o: o.replace("_", " ").title() for o in DECISION_IMPACT_OPTIONS}
 
 
 def render_intake_form() -> Optional[Dict[str, Any]]:
     with st.form("assessment_form"):
 
-        render_section_card("System Information", "📋", "#8b5cf6")
+        render_section_card("system")
         col1, col2 = st.columns(2)
         with col1:
             system_name = st.text_input("AI System Name", placeholder="e.g., RecruitAI Pro")
         with col2:
             team_name = st.text_input("Team / Department", value="Engineering", placeholder="e.g., HR Technology")
 
-        render_section_card("Scope & Purpose", "🎯", "#22c55e")
+        render_section_card("scope")
         sector = st.selectbox(
             "Sector",
-            options=["hiring", "credit_scoring", "healthcare", "education", "law_enforcement",
-                    "critical_infrastructure", "insurance", "social_services", "recommender",
-                    "customer_service", "manufacturing", "logistics", "other"],
-            format_func=lambda x: {
-                "hiring": "Hiring / Recruitment", "credit_scoring": "Credit Scoring / Financial",
-                "healthcare": "Healthcare / Medical", "education": "Education",
-                "law_enforcement": "Law Enforcement / Security", "critical_infrastructure": "Critical Infrastructure",
-                "insurance": "Insurance", "social_services": "Social Services / Benefits",
-                "recommender": "Recommendations / Content", "customer_service": "Customer Service",
-                "manufacturing": "Manufacturing / Industrial", "logistics": "Logistics / Supply Chain",
-                "other": "Other"
-            }.get(x, x)
+            options=SECTOR_OPTIONS,
+            format_func=SECTOR_LABELS.get
         )
         use_case = st.text_area("Use Case Description", placeholder="Describe what your AI system does, its main purpose, and how decisions are made...", height=120)
 
-        render_section_card("Data Processing", "🔐", "#3b82f6")
+        render_section_card("data")
         data_types = st.multiselect(
             "Data Types Processed",
-            options=["biometrics", "health_data", "financial_data", "criminal_records",
-                    "political_opinions", "religious_beliefs", "ethnic_origin", "location_data",
-                    "behavioral_data", "employment_data", "educational_records", "generic_pii", "anonymous_data"],
+            options=DATA_TYPE_OPTIONS,
             default=["generic_pii"],
-            format_func=lambda x: x.replace("_", " ").title()
+            format_func=DATA_TYPE_LABELS.get
         )
 
-        render_section_card("Impact Assessment", "⚡", "#f59e0b")
+        render_section_card("impact")
         col1, col2 = st.columns(2)
         with col1:
             user_types = st.multiselect(
                 "Affected Users",
-                options=["general_public", "employees", "children", "elderly", "vulnerable_groups", "patients", "students", "consumers"],
+                options=USER_TYPE_OPTIONS,
                 default=["employees"],
-                format_func=lambda x: x.replace("_", " ").title()
+                format_func=USER_TYPE_LABELS.get
             )
         with col2:
             decision_impacts = st.multiselect(
                 "Decision Types",
-                options=["employment_decisions", "credit_decisions", "access_to_services", "educational_outcomes",
-                        "health_treatment", "legal_decisions", "law_enforcement_actions", "safety_critical",
-                        "recommendations", "operational_efficiency"],
+                options=DECISION_IMPACT_OPTIONS,
                 default=["employment_decisions"],
-                format_func=lambda x: x.replace("_", " ").title()
+                format_func=DECISION_IMPACT_LABELS.get
             )
 
-        render_section_card("Human Oversight", "👁️", "#ec4899")
+        render_section_card("oversight")
         oversight_level = st.radio(
             "Oversight Level",
-            options=["fully_automated", "human_on_the_loop", "human_in_the_loop", "human_override_possible", "human_final_decision"],
+            options=OVERSIGHT_OPTIONS,
             index=2,
-            format_func=lambda x: {
-                "fully_automated": "Fully Automated — No human review",
-                "human_on_the_loop": "Human Monitoring — System acts autonomously",
-                "human_in_the_loop": "Human Review — Each decision reviewed",
-                "human_override_possible": "Human Override — Can intervene anytime",
-                "human_final_decision": "Human Final — All decisions by humans"
-            }.get(x, x)
+            format_func=OVERSIGHT_LABELS.get
         )
 
         st.markdown("<div style='height: 12px;'></div>", unsafe_allow_html=True)
@@ -544,12 +622,67 @@ def render_intake_form() -> Optional[Dict[str, Any]]:
                 "data_types": data_types, "decision_impacts": decision_impacts,
                 "oversight_level": oversight_level, "can_users_opt_out": can_opt_out,
                 "appeal_mechanism": has_appeal,
-                "documentation": {k: "not_started" for k in ["data_sheet", "model_card", "system_logs",
-                    "monitoring_dashboard", "risk_assessment", "bias_audit", "technical_documentation", "user_instructions"]}
+                "documentation": dict(DEFAULT_DOCUMENTATION)
             }
     return None
 
 
+# Color schemes for different risk levels:
+# category -> (color, bg, gradient_bg, label, ring_color); anything else is low
+RISK_STYLES = {
+    "high_risk": (
+        "#dc2626", "#fef2f2", "linear-gradient(135deg, #fef2f2 0%, #fee2e2 100%)",
+        "HIGH RISK", "rgba(220, 38, 38, 0.2)",
+    ),
+    "medium_risk": (
+        "#d97706", "#fffbeb", "linear-gradient(135deg, #fffbeb 0%, #fef3c7 100%)",
+        "MEDIUM RISK", "rgba(217, 119, 6, 0.2)",
+    ),
+    "low_risk": (
+        "#16a34a", "#f0fdf4", "linear-gradient(135deg, #f0fdf4 0%, #dcfce7 100%)",
+        "LOW RISK", "rgba(22, 163, 74, 0.2)",
+    ),
+}
+
+# Finding severity -> (border_col, badge_bg, badge_col)
+SEVERITY_COLORS = {
+    "high": ("#dc2626", "#fef2f2", "#dc2626"),
+    "medium": ("#d97706", "#fffbeb", "#d97706"),
+    "low": ("#16a34a", "#f0fdf4", "#16a34a"),
+}
+
+SEVERITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+
+def build_findings(result: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Rank risk factors and high-priority obligations; keep the top 8."""
+    risk_factors = result.get("risk_factors", [])
+    obligations = result.get("obligations", [])
+
+    findings = []
+    for f in risk_factors:
+        w = f.get("weight", 0)
+        if w >= 0:
+            findings.append({
+                "article": f.get("article_reference", ""),
+                "desc": f.get("description", ""),
+                "severity": "high" if w >= 0.7 else "medium" if w >= 0.4 else "low",
+                "score": int(w * 100)
+            })
+
+    for ob in obligations:
+        if ob.get("priority") == "high":
+            findings.append({
+                "article": ob.get("article_reference", ""),
+                "desc": f"{ob.get('title', '')}: {ob.get('description', '')}",
+                "severity": "high",
+                "score": 80
+            })
+
+    findings.sort(key=lambda x: (SEVERITY_ORDER[x["severity"]], -x["score"]))
+    return findings[:8]
+
+
 def render_results(result: Dict[str, Any]):
     st.markdown("<div style='height: 20px;'></div>", unsafe_allow_html=True)
 
@@ -557,25 +690,7 @@ def render_results(result: Dict[str, Any]):
     risk_category = result.get("risk_category", "medium_risk")
     risk_pct = int(risk_score * 100)
 
-    # Color schemes for different risk levels
-    if risk_category == "high_risk":
-        color = "#dc2626"
-        bg = "#fef2f2"
-        gradient_bg = "linear-gradient(135deg, #fef2f2 0%, #fee2e2 100%)"
-        label = "HIGH RISK"
-        ring_color = "rgba(220, 38, 38, 0.2)"
-    elif risk_category == "medium_risk":
-        color = "#d97706"
-        bg = "#fffbeb"
-        gradient_bg = "linear-gradient(135deg, #fffbeb 0%, #fef3c7 100%)"
-        label = "MEDIUM RISK"
-        ring_color = "rgba(217, 119, 6, 0.2)"
-    else:
-        color = "#16a34a"
-        bg = "#f0fdf4"
-        gradient_bg = "linear-gradient(135deg, #f0fdf4 0%, #dcfce7 100%)"
-        label = "LOW RISK"
-        ring_color = "rgba(22, 163, 74, 0.2)"
+    color, bg, gradient_bg, label, ring_color = RISK_STYLES.get(risk_category, RISK_STYLES["low_risk"])
 
     # Beautiful score display card
     st.markdown(f"""
@@ -633,48 +748,21 @@ def render_results(result: Dict[str, Any]):
     """, unsafe_allow_html=True)
 
     # Risk Factors / Article Analysis
-    risk_factors = result.get("risk_factors", [])
-    obligations = result.get("obligations", [])
-
-    findings = []
-    for f in risk_factors:
-        w = f.get("weight", 0)
-        if w >= 0:
-            findings.append({
-                "article": f.get("article_reference", ""),
-                "desc": f.get("description", ""),
-                "severity": "high" if w >= 0.7 else "medium" if w >= 0.4 else "low",
-                "score": int(w * 100)
-            })
-
-    for ob in obligations:
-        if ob.get("priority") == "high":
-            findings.append({
-                "article": ob.get("article_reference", ""),
-                "desc": f"{ob.get('title', '')}: {ob.get('description', '')}",
-                "severity": "high",
-                "score": 80
-            })
+    findings = build_findings(result)
 
     if findings:
-        findings.sort(key=lambda x: ({"high": 0, "medium": 1, "low": 2}.get(x["severity"], 2), -x["score"]))
-
         st.markdown("""
         <div style="font-family: 'Barlow', sans-serif; font-size: 18px; font-weight: 700; color: #1a1a1a; margin: 28px 0 16px 0;">
             EU AI Act Article Analysis
         </div>
         """, unsafe_allow_html=True)
 
-        for f in findings[:8]:
-            sev = f["severity"]
-            if sev == "high":
-                border_col, badge_bg, badge_col = "#dc2626", "#fef2f2", "#dc2626"
-            elif sev == "medium":
-                border_col, badge_bg, badge_col = "#d97706", "#fffbeb", "#d97706"
-            else:
-                border_col, badge_bg, badge_col = "#16a34a", "#f0fdf4", "#16a34a"
+        # Cards are batched into a single markdown element per section
+        parts = []
+        for f in findings:
+            border_col, badge_bg, badge_col = SEVERITY_COLORS[f["severity"]]
 
-            st.markdown(f"""
+            parts.append(f"""
             <div style="
                 background: white;
                 border-radius: 12px;
@@ -703,7 +791,8 @@ def render_results(result: Dict[str, Any]):
                     white-space: nowrap;
                 ">{f['score']}%</div>
             </div>
-            """, unsafe_allow_html=True)
+            """)
+        st.markdown("".join(parts), unsafe_allow_html=True)
 
     # Recommendations
     recs = result.get("key_recommendations", [])
@@ -714,8 +803,9 @@ def render_results(result: Dict[str, Any]):
         </div>
         """, unsafe_allow_html=True)
 
+        parts = []
         for i, rec in enumerate(recs, 1):
-            st.markdown(f"""
+            parts.append(f"""
             <div style="
                 background: white;
                 border-radius: 12px;
@@ -743,7 +833,8 @@ def render_results(result: Dict[str, Any]):
                 ">{i}</div>
                 <div style="font-family: 'Barlow', sans-serif; font-size: 14px; color: #374151; line-height: 1.6; padding-top: 4px;">{rec}</div>
             </div>
-            """, unsafe_allow_html=True)
+            """)
+        st.markdown("".join(parts), unsafe_allow_html=True)
 
     # Documentation gaps
     gaps = result.get("documentation_gaps", [])
@@ -754,8 +845,9 @@ def render_results(result: Dict[str, Any]):
         </div>
         """, unsafe_allow_html=True)
 
+        parts = []
         for gap in gaps:
-            st.markdown(f"""
+            parts.append(f"""
             <div style="
                 background: #fffbeb;
                 border-radius: 10px;
@@ -772,7 +864,8 @@ def render_results(result: Dict[str, Any]):
                 <span style="font-size: 16px;">⚠️</span>
                 {gap}
             </div>
-            """, unsafe_allow_html=True)
+            """)
+        st.markdown("".join(parts), unsafe_allow_html=True)
 
     # Action buttons
     st.markdown("<div style='height: 32px;'></div>", unsafe_allow_html=True)
@@ -780,13 +873,16 @@ def render_results(result: Dict[str, Any]):
     with col1:
         st.download_button(
             "Download Report",
-            json.dumps(result, indent=2),
+            # Serialized only when the button is clicked
+            lambda: json.dumps(result, indent=2),
             f"ai_audit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
             "application/json",
             use_container_width=True
         )
     with col3:
         if st.button("New Assessment", use_container_width=True):
+            for key in RESULT_STATE_KEYS:
+                st.session_state.pop(key, None)
             st.session_state.gradient = random.choice(GRADIENTS)
             st.rerun()
 
@@ -795,10 +891,21 @@ def main():
     render_header()
     intake_data = render_intake_form()
     if intake_data:
-        with st.spinner("Analyzing compliance..."):
-            result = assess_intake(intake_data)
-            if result:
-                render_results(result)
+        # Only POST when the submitted intake differs from the one on display
+        result_key = json.dumps(intake_data, sort_keys=True)
+        if st.session_state.get("result_key") != result_key:
+            with st.spinner("Analyzing compliance..."):
+                result = assess_intake(intake_data)
+            if not result:
+                for key in RESULT_STATE_KEYS:
+                    st.session_state.pop(key, None)
+                return
+            st.session_state.result = result
+            st.session_state.result_key = result_key
+
+    # Results persist across reruns until the next assessment
+    if "result" in st.session_state:
+        render_results(st.session_state.result)
 
 
 if __name__ == "__main__":
@@ -12,6 +12,7 @@ Usage:
 Endpoints:
     GET  /health              - Health check
     POST /predict             - Risk classification
+    POST /predict_batch       - Risk classification for many texts
     POST /assess_and_remediate - Full assessment with remediation plan
 """
 
@@ -30,10 +31,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from src import __version__
 from src.api.schemas import (
+    BatchPrediction,
+    BatchPredictRequest,
+    BatchPredictResponse,
     ErrorResponse,
     HealthResponse,
     PredictRequest,
     PredictResponse,
+    RemediationItem,
     RemediationRequest,
     RemediationResponse,
 )
@@ -42,7 +47,13 @@ from src.api.intake_schema import (
     IntakeAssessmentResponse,
     SnapshotRecord,
 )
-from src.models.predict import load_model, predict_text
+from src.models.predict import (
+    DEFAULT_CLASS_NAMES,
+    load_label_encoder,
+    load_model,
+    predict_batch,
+    predict_text,
+)
 from src.remediation.generator import generate_remediation_plan, load_templates
 from src.scoring.risk_engine import assess_intake_form
 from src.utils.config import load_config, get_project_root
@@ -51,14 +62,30 @@ from src.utils.config import load_config, get_project_root
 # Global state for loaded resources
 class AppState:
     """Container for application state."""
-    config: Optional[Dict[str, Any]] = None
-    pipeline: Optional[Any] = None
-    templates: Optional[Dict[str, Any]] = None
-    model_version: str = "not_loaded"
-    template_version: str = "1.0.0"
-    startup_time: Optional[datetime] = None
-    # Snapshot storage (in-memory for demo; use database in production)
-    snapshots: Dict[str, List[SnapshotRecord]] = {}
+    __slots__ = (
+        "config",
+        "pipeline",
+        "templates",
+        "model_version",
+        "template_version",
+        "label_encoder_path",
+        "class_names",
+        "startup_time",
+        "snapshots",
+    )
+
+    def __init__(self) -> None:
+        self.config: Optional[Dict[str, Any]] = None
+        self.pipeline: Optional[Any] = None
+        self.templates: Optional[Dict[str, Any]] = None
+        self.model_version: str = "not_loaded"
+        self.template_version: str = "1.0.0"
+        # Resolved once at startup rather than per request
+        self.label_encoder_path: str = "artifacts/label_encoder.json"
+        self.class_names: Optional[List[str]] = None
+        self.startup_time: Optional[datetime] = None
+        # Snapshot storage (in-memory for demo; use database in production)
+        self.snapshots: Dict[str, List[SnapshotRecord]] = {}
 
 
 state = AppState()
@@ -123,6 +150,15 @@ async def lifespan(app: FastAPI):
         print("The /predict and /assess_and_remediate endpoints will return errors.")
         state.pipeline = None
 
+    # Load label encoder class names
+    state.label_encoder_path = str(project_root / "artifacts" / "label_encoder.json")
+    try:
+        state.class_names = load_label_encoder(state.label_encoder_path)["classes"]
+    except (FileNotFoundError, ValueError, KeyError):
+        print(f"Warning: Label encoder missing or invalid at {state.label_encoder_path}")
+        print("Using default class names.")
+        state.class_names = list(DEFAULT_CLASS_NAMES)
+
     # Load templates
     template_path = project_root / "templates" / "article_remediations.yml"
 
@@ -172,6 +208,8 @@ app.add_middleware(
 # ============================================================================
 # Endpoints
 # ============================================================================
+# Endpoints that run the model or build plans are plain ``def`` so FastAPI
+# runs them in its threadpool instead of blocking the event loop.
 
 @app.get(
     "/health",
@@ -206,7 +244,7 @@ async def health_check():
         503: {"model": ErrorResponse, "description": "Model not loaded"}
     }
 )
-async def predict(request: PredictRequest):
+def predict(request: PredictRequest):
     """
     Predict the EU AI Act risk level for AI system documentation.
 
@@ -233,16 +271,15 @@ async def predict(request: PredictRequest):
         )
 
     try:
-        project_root = get_project_root()
-        encoder_path = project_root / "artifacts" / "label_encoder.json"
-
         label, probs = predict_text(
             state.pipeline,
             request.text,
-            label_encoder_path=str(encoder_path)
+            label_encoder_path=state.label_encoder_path,
+            class_names=state.class_names
         )
 
-        return PredictResponse(
+        # Built from our own model output, so field validation is skipped
+        return PredictResponse.model_construct(
             predicted_label=label,
             probabilities=probs,
             model_version=state.model_version
@@ -259,6 +296,72 @@ async def predict(request: PredictRequest):
         )
 
 
+@app.post(
+    "/predict_batch",
+    response_model=BatchPredictResponse,
+    tags=["Prediction"],
+    summary="Classify risk level of several AI documents at once",
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid input"},
+        503: {"model": ErrorResponse, "description": "Model not loaded"}
+    }
+)
+def predict_batch_endpoint(request: BatchPredictRequest):
+    """
+    Predict the EU AI Act risk level for several documents in one call.
+
+    All texts go through the pipeline as a single batch, so vectorization
+    and classification run once instead of once per document.
+
+    Args:
+        request: BatchPredictRequest with texts to classify.
+
+    Returns:
+        BatchPredictResponse with one prediction per text, in request order.
+
+    Raises:
+        HTTPException 503: If model is not loaded.
+    """
+    if state.pipeline is None:
+        raise HTTPException(
+            status_code=503,
+            detail={
+                "error": "ServiceUnavailable",
+                "message": "Model not loaded. Please run training first.",
+                "detail": "Execute: python -m src.models.train --config config.yaml"
+            }
+        )
+
+    try:
+        results = predict_batch(
+            state.pipeline,
+            request.texts,
+            label_encoder_path=state.label_encoder_path,
+            class_names=state.class_names
+        )
+
+        return BatchPredictResponse.model_construct(
+            predictions=[
+                BatchPrediction.model_construct(
+                    predicted_label=result["label"],
+                    probabilities=result["probabilities"]
+                )
+                for result in results
+            ],
+            model_version=state.model_version
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "PredictionError",
+                "message": str(e),
+                "detail": None
+            }
+        )
+
+
 @app.post(
     "/assess_and_remediate",
     response_model=RemediationResponse,
@@ -269,7 +372,7 @@ async def predict(request: PredictRequest):
         503: {"model": ErrorResponse, "description": "Model or templates not loaded"}
     }
 )
-async def assess_and_remediate(request: RemediationRequest):
+def assess_and_remediate(request: RemediationRequest):
     """
     Perform full EU AI Act compliance assessment and generate remediation plan.
 
@@ -309,20 +412,22 @@ async def assess_and_remediate(request: RemediationRequest):
         )
 
     try:
-        project_root = get_project_root()
-        encoder_path = project_root / "artifacts" / "label_encoder.json"
-
         # Get model predictions
         label, probs = predict_text(
             state.pipeline,
             request.text,
-            label_encoder_path=str(encoder_path)
+            label_encoder_path=state.label_encoder_path,
+            class_names=state.class_names
         )
 
-        # Override top_k in config if provided
-        config = state.config.copy() if state.config else {}
+        # Override top_k in config if provided; the shared config is never
+        # mutated, only the remediation section is rebuilt for this request
+        config = state.config or {}
         if request.top_k:
-            config.setdefault("remediation", {})["top_k_remediations"] = request.top_k
+            config = {
+                **config,
+                "remediation": {**config.get("remediation", {}), "top_k_remediations": request.top_k}
+            }
 
         # Generate remediation plan
         plan = generate_remediation_plan(
@@ -332,13 +437,14 @@ async def assess_and_remediate(request: RemediationRequest):
             config=config
         )
 
-        return RemediationResponse(
+        # The plan is generated server-side, so field validation is skipped
+        return RemediationResponse.model_construct(
             summary=plan["summary"],
             risk_level=plan["risk_level"],
             confidence=plan["confidence"],
             matched_keywords=plan["matched_keywords"],
             article_scores=plan["article_scores"],
-            items=plan["items"],
+            items=[RemediationItem.model_construct(**item) for item in plan["items"]],
             disclaimer=plan["disclaimer"],
             model_version=state.model_version,
             template_version=state.template_version
@@ -364,7 +470,7 @@ async def assess_and_remediate(request: RemediationRequest):
         400: {"model": ErrorResponse, "description": "Invalid input"},
     }
 )
-async def assess_intake(intake: AISystemIntake):
+def assess_intake(intake: AISystemIntake):
     """
     Perform comprehensive AI system assessment using structured intake form.
 
@@ -386,13 +492,12 @@ async def assess_intake(intake: AISystemIntake):
         # Get ML prediction if model is available and there's documentation text
         ml_risk_score = None
         if state.pipeline is not None and intake.additional_documentation:
-            project_root = get_project_root()
-            encoder_path = project_root / "artifacts" / "label_encoder.json"
             try:
                 label, probs = predict_text(
                     state.pipeline,
                     intake.additional_documentation,
-                    label_encoder_path=str(encoder_path)
+                    label_encoder_path=state.label_encoder_path,
+                    class_names=state.class_names
                 )
                 # Convert to risk score (high=1.0, medium=0.5, low=0.0)
                 ml_risk_score = probs.get("high", 0) + 0.5 * probs.get("medium", 0)
@@ -403,13 +508,12 @@ async def assess_intake(intake: AISystemIntake):
         remediation_items = []
         if state.templates and intake.additional_documentation:
             try:
-                config = state.config.copy() if state.config else {}
                 probs = {"high": ml_risk_score or 0.5, "medium": 0.3, "low": 0.2}
                 plan = generate_remediation_plan(
                     text=intake.use_case_description + " " + (intake.additional_documentation or ""),
                     model_probs=probs,
                     templates=state.templates,
-                    config=config
+                    config=state.config or {}
                 )
                 remediation_items = plan.get("items", [])
             except Exception:
@@ -422,12 +526,10 @@ async def assess_intake(intake: AISystemIntake):
             remediation_items=remediation_items
         )
 
-        # Store snapshot
+        # Store snapshot (setdefault keeps concurrent worker threads from
+        # replacing each other's history list)
         system_key = f"{intake.system_name}_{intake.team_name}"
-        if system_key not in state.snapshots:
-            state.snapshots[system_key] = []
-
-        state.snapshots[system_key].append(SnapshotRecord(
+        state.snapshots.setdefault(system_key, []).append(SnapshotRecord(
             snapshot_id=response.assessment_id,
             system_name=intake.system_name,
             system_version=intake.system_version,
@@ -464,7 +566,9 @@ async def get_snapshots(system_name: str):
     from typing import List as TypingList
 
     matching_snapshots: TypingList[SnapshotRecord] = []
-    for key, snapshots in state.snapshots.items():
+    # Copy the items first: assess_intake runs in the threadpool and may add
+    # a new system key while this loop is running
+    for key, snapshots in list(state.snapshots.items()):
         if system_name.lower() in key.lower():
             matching_snapshots.extend(snapshots)
 
@@ -487,7 +591,8 @@ async def root():
         "endpoints": {
             "intake_assessment": "/assess_intake",
             "text_assessment": "/assess_and_remediate",
-            "predict": "/predict"
+            "predict": "/predict",
+            "predict_batch": "/predict_batch"
         }
     }
 
@@ -5,7 +5,7 @@ This module defines request and response models for the FastAPI endpoints.
 All models include validation and documentation for OpenAPI spec generation.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -32,6 +32,27 @@ class PredictRequest(BaseModel):
         }
 
 
+class BatchPredictRequest(BaseModel):
+    """Request model for /predict_batch endpoint."""
+
+    texts: List[Annotated[str, Field(min_length=10, max_length=50000)]] = Field(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="AI system documentation texts to classify in one pass"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "texts": [
+                    "This AI system uses facial recognition for access control...",
+                    "A chatbot that answers customer questions about opening hours..."
+                ]
+            }
+        }
+
+
 class RemediationRequest(BaseModel):
     """Request model for /assess_and_remediate endpoint."""
 
@@ -91,6 +112,43 @@ class PredictResponse(BaseModel):
         }
 
 
+class BatchPrediction(BaseModel):
+    """Prediction for a single text in a batch."""
+
+    predicted_label: str = Field(..., description="Predicted risk level: high, medium, or low")
+    probabilities: Dict[str, float] = Field(..., description="Probability distribution over risk levels")
+
+
+class BatchPredictResponse(BaseModel):
+    """Response model for /predict_batch endpoint."""
+
+    predictions: List[BatchPrediction] = Field(
+        ...,
+        description="Predictions in the same order as the request texts"
+    )
+    model_version: str = Field(
+        ...,
+        description="Version identifier of the prediction model"
+    )
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "predictions": [
+                    {
+                        "predicted_label": "high",
+                        "probabilities": {"high": 0.75, "medium": 0.20, "low": 0.05}
+                    },
+                    {
+                        "predicted_label": "low",
+                        "probabilities": {"high": 0.05, "medium": 0.15, "low": 0.80}
+                    }
+                ],
+                "model_version": "1.0.0"
+            }
+        }
+
+
 class RemediationItem(BaseModel):
     """Single remediation action item."""
 
@@ -13,12 +13,15 @@ Usage:
 
 import json
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import joblib
 import numpy as np
 from sklearn.pipeline import Pipeline
 
+# Class names used when no label encoder file is available
+DEFAULT_CLASS_NAMES = ["high", "low", "medium"]
+
 
 def load_model(path: str = "artifacts/model.joblib") -> Pipeline:
     """
@@ -80,7 +83,8 @@ def load_label_encoder(path: str = "artifacts/label_encoder.json") -> Dict[str,
 def predict_text(
     pipeline: Pipeline,
     text: str,
-    label_encoder_path: str = "artifacts/label_encoder.json"
+    label_encoder_path: str = "artifacts/label_encoder.json",
+    class_names: Optional[List[str]] = None
 ) -> Tuple[str, Dict[str, float]]:
     """
     Predict risk label and probabilities for a text document.
@@ -89,6 +93,8 @@ def predict_text(
         pipeline: Trained sklearn pipeline with predict and predict_proba.
         text: Input text document to classify.
         label_encoder_path: Path to label encoder JSON for class names.
+        class_names: Preloaded class names; when given, the label encoder
+            file is not read.
 
     Returns:
         Tuple of (predicted_label, class_probabilities_dict).
@@ -102,12 +108,13 @@ def predict_text(
         {'high': 0.75, 'medium': 0.20, 'low': 0.05}
     """
     # Load label encoder to get class names
-    try:
-        encoder_data = load_label_encoder(label_encoder_path)
-        class_names = encoder_data["classes"]
-    except FileNotFoundError:
-        # Fallback to default class names
-        class_names = ["high", "low", "medium"]
+    if class_names is None:
+        try:
+            encoder_data = load_label_encoder(label_encoder_path)
+            class_names = encoder_data["classes"]
+        except FileNotFoundError:
+            # Fallback to default class names
+            class_names = DEFAULT_CLASS_NAMES
 
     # Predict
     X = [text]
@@ -134,7 +141,8 @@ def predict_text(
 def predict_batch(
     pipeline: Pipeline,
     texts: list,
-    label_encoder_path: str = "artifacts/label_encoder.json"
+    label_encoder_path: str = "artifacts/label_encoder.json",
+    class_names: Optional[List[str]] = None
 ) -> list:
     """
     Predict risk labels and probabilities for multiple documents.
@@ -143,6 +151,8 @@ def predict_batch(
         pipeline: Trained sklearn pipeline.
         texts: List of text documents to classify.
         label_encoder_path: Path to label encoder JSON.
+        class_names: Preloaded class names; when given, the label encoder
+            file is not read.
 
     Returns:
         List of dicts, each with 'label' and 'probabilities' keys.
@@ -152,11 +162,12 @@ def predict_batch(
         >>> print(results[0])
         {'label': 'high', 'probabilities': {'high': 0.8, 'medium': 0.15, 'low': 0.05}}
     """
-    try:
-        encoder_data = load_label_encoder(label_encoder_path)
-        class_names = encoder_data["classes"]
-    except FileNotFoundError:
-        class_names = ["high", "low", "medium"]
+    if class_names is None:
+        try:
+            encoder_data = load_label_encoder(label_encoder_path)
+            class_names = encoder_data["classes"]
+        except FileNotFoundError:
+            class_names = DEFAULT_CLASS_NAMES
 
     # Predict all at once for efficiency
     y_pred = pipeline.predict(texts)
@@ -94,6 +94,16 @@ OVERSIGHT_RISK_MODIFIERS = {
     OversightLevel.HUMAN_FINAL_DECISION: 0.40,  # Lowest risk
 }
 
+# Enum buckets used for membership checks, built once at import
+GAP_DOCUMENTATION_STATUSES = frozenset({
+    DocumentationStatus.NOT_STARTED,
+    DocumentationStatus.NEEDS_UPDATE,
+})
+
+BIAS_AUDIT_DATA_TYPES = frozenset({DataType.BIOMETRICS, DataType.HEALTH_DATA})
+
+VULNERABLE_USER_TYPES = frozenset({UserType.CHILDREN, UserType.VULNERABLE_GROUPS})
+
 
 def compute_base_risk_score(intake: AISystemIntake) -> Tuple[float, List[RiskFactor]]:
     """
@@ -116,7 +126,6 @@ def compute_base_risk_score(intake: AISystemIntake) -> Tuple[float, List[RiskFac
     # 2. User type risk (max of all user types)
     user_weights = [USER_TYPE_RISK_WEIGHTS.get(ut, 0.5) for ut in intake.user_types]
     max_user_weight = max(user_weights) if user_weights else 0.5
-    vulnerable_users = [ut for ut in intake.user_types if ut in [UserType.CHILDREN, UserType.VULNERABLE_GROUPS, UserType.ELDERLY]]
 
     factors.append(RiskFactor(
         factor="user_types",
@@ -213,11 +222,11 @@ def compute_documentation_gaps(intake: AISystemIntake) -> List[str]:
 
     for field, name in required_docs:
         status = getattr(doc, field)
-        if status in [DocumentationStatus.NOT_STARTED, DocumentationStatus.NEEDS_UPDATE]:
+        if status in GAP_DOCUMENTATION_STATUSES:
             gaps.append(name)
 
     # Additional gaps based on risk level
-    if any(dt in intake.data_types for dt in [DataType.BIOMETRICS, DataType.HEALTH_DATA]):
+    if not BIAS_AUDIT_DATA_TYPES.isdisjoint(intake.data_types):
         if doc.bias_audit != DocumentationStatus.COMPLETE:
             gaps.append("Bias Audit (required for sensitive data)")
 
@@ -336,7 +345,7 @@ def generate_obligations(risk_score: float, intake: AISystemIntake) -> List[Comp
             article_reference="Article 6 - Annex III"
         ))
 
-    if any(ut in intake.user_types for ut in [UserType.CHILDREN, UserType.VULNERABLE_GROUPS]):
+    if not VULNERABLE_USER_TYPES.isdisjoint(intake.user_types):
         obligations.append(ComplianceObligation(
             id="OB-VUL-001",
             title="Vulnerable Population Safeguards",
@@ -458,12 +467,15 @@ def assess_intake_form(
     recommendations = generate_key_recommendations(final_score, factors, documentation_gaps)
     executive_summary = generate_executive_summary(intake, final_score, risk_category, obligations, recommendations)
 
-    # Generate assessment ID
+    # Generate assessment ID from the same instant reported as its timestamp
+    assessment_timestamp = datetime.utcnow().isoformat()
     assessment_id = hashlib.sha256(
-        f"{intake.system_name}{intake.system_version}{datetime.utcnow().isoformat()}".encode()
+        f"{intake.system_name}{intake.system_version}{assessment_timestamp}".encode()
     ).hexdigest()[:12]
 
-    return IntakeAssessmentResponse(
+    # Every field is computed above from the validated intake, so the
+    # response skips a second round of field validation
+    return IntakeAssessmentResponse.model_construct(
         risk_score=round(final_score, 3),
         risk_category=risk_category,
         risk_label=risk_label,
@@ -473,7 +485,7 @@ def assess_intake_form(
         key_recommendations=recommendations,
         remediation_items=remediation_items or [],
         assessment_id=assessment_id,
-        assessment_timestamp=datetime.utcnow().isoformat(),
+        assessment_timestamp=assessment_timestamp,
         model_version="1.0.0",
         executive_summary=executive_summary
     )
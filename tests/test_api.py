@@ -187,6 +187,23 @@ class TestPredictEndpoint:
             assert "probabilities" in data
             assert isinstance(data["probabilities"], dict)
 
+    def test_predict_uses_preloaded_class_names(self, client_with_mocks):
+        """Test that predict reuses the class names loaded at startup."""
+        from src.api.main import state
+
+        with patch.object(state, 'class_names', ["high", "low", "medium"]), \
+             patch('src.api.main.predict_text') as mock_predict:
+            mock_predict.return_value = ("high", {"high": 0.8, "medium": 0.15, "low": 0.05})
+
+            response = client_with_mocks.post(
+                "/predict",
+                json={"text": "This is a test AI system documentation."}
+            )
+            assert response.status_code == 200
+            assert response.json()["predicted_label"] == "high"
+            _, kwargs = mock_predict.call_args
+            assert kwargs["class_names"] == ["high", "low", "medium"]
+
     def test_predict_validates_text_length(self, client_with_mocks):
         """Test that predict validates minimum text length."""
         response = client_with_mocks.post(
@@ -204,6 +221,57 @@ class TestPredictEndpoint:
         assert response.status_code == 503
 
 
+# ============================================================================
+# Batch Predict Endpoint Tests
+# ============================================================================
+
+class TestPredictBatchEndpoint:
+    """Tests for /predict_batch endpoint."""
+
+    def test_predict_batch_returns_prediction_per_text(self, client_with_mocks):
+        """Test that predict_batch returns one prediction per text, in order."""
+        with patch('src.api.main.predict_batch') as mock_predict:
+            mock_predict.return_value = [
+                {"label": "high", "probabilities": {"high": 0.8, "medium": 0.15, "low": 0.05}},
+                {"label": "low", "probabilities": {"high": 0.05, "medium": 0.15, "low": 0.8}},
+            ]
+
+            response = client_with_mocks.post(
+                "/predict_batch",
+                json={"texts": [
+                    "This is a test AI system documentation.",
+                    "Another test AI system documentation."
+                ]}
+            )
+            assert response.status_code == 200
+            data = response.json()
+            labels = [p["predicted_label"] for p in data["predictions"]]
+            assert labels == ["high", "low"]
+            assert "model_version" in data
+            mock_predict.assert_called_once()
+
+    def test_predict_batch_rejects_empty_list(self, client_with_mocks):
+        """Test that predict_batch requires at least one text."""
+        response = client_with_mocks.post("/predict_batch", json={"texts": []})
+        assert response.status_code == 422
+
+    def test_predict_batch_validates_text_length(self, client_with_mocks):
+        """Test that predict_batch validates each text's minimum length."""
+        response = client_with_mocks.post(
+            "/predict_batch",
+            json={"texts": ["This is a test AI system documentation.", "short"]}
+        )
+        assert response.status_code == 422
+
+    def test_predict_batch_503_without_model(self, client_without_model):
+        """Test that predict_batch returns 503 when model not loaded."""
+        response = client_without_model.post(
+            "/predict_batch",
+            json={"texts": ["This is a test AI system documentation."]}
+        )
+        assert response.status_code == 503
+
+
 # ============================================================================
 # Assess and Remediate Endpoint Tests
 # ============================================================================
@@ -292,6 +360,41 @@ class TestAssessAndRemediateEndpoint:
             assert "items" in data
             assert isinstance(data["items"], list)
 
+    def test_assess_serializes_remediation_item_fields(self, client_with_mocks):
+        """Test that every remediation item field reaches the response."""
+        item = {
+            "article": "Article_9",
+            "article_name": "Risk Management",
+            "article_score": 0.8,
+            "remediation_id": "A9-R1",
+            "title": "Test",
+            "description": "Test desc",
+            "urgency": "high",
+            "estimated_effort": "1 week",
+            "priority": 1
+        }
+        with patch('src.api.main.predict_text') as mock_predict, \
+             patch('src.api.main.generate_remediation_plan') as mock_generate:
+
+            mock_predict.return_value = ("high", {"high": 0.8, "medium": 0.15, "low": 0.05})
+            mock_generate.return_value = {
+                "summary": "Test summary",
+                "risk_level": "high",
+                "confidence": 0.8,
+                "matched_keywords": ["test"],
+                "article_scores": {"Article_9": 0.8},
+                "items": [item],
+                "disclaimer": "Test disclaimer"
+            }
+
+            response = client_with_mocks.post(
+                "/assess_and_remediate",
+                json={"text": "This is a test AI system documentation."}
+            )
+            data = response.json()
+            assert data["items"] == [item]
+            assert data["model_version"] == "test-1.0.0"
+
     def test_assess_503_without_model(self, client_without_model):
         """Test that assess returns 503 when model not loaded."""
         response = client_without_model.post(
@@ -322,6 +425,33 @@ class TestAssessAndRemediateEndpoint:
             )
             assert response.status_code == 200
 
+    def test_assess_top_k_does_not_leak_into_shared_config(self, client_with_mocks):
+        """Test that a per-request top_k leaves the app config untouched."""
+        from src.api.main import state
+
+        with patch('src.api.main.predict_text') as mock_predict, \
+             patch('src.api.main.generate_remediation_plan') as mock_generate:
+
+            mock_predict.return_value = ("high", {"high": 0.8, "medium": 0.15, "low": 0.05})
+            mock_generate.return_value = {
+                "summary": "Test summary",
+                "risk_level": "high",
+                "confidence": 0.8,
+                "matched_keywords": [],
+                "article_scores": {},
+                "items": [],
+                "disclaimer": "Test disclaimer"
+            }
+
+            client_with_mocks.post(
+                "/assess_and_remediate",
+                json={"text": "This is a test AI system documentation.", "top_k": 7}
+            )
+            passed_config = mock_generate.call_args.kwargs["config"]
+            assert passed_config["remediation"]["top_k_remediations"] == 7
+            assert passed_config["remediation"]["alpha"] == 0.6
+            assert state.config["remediation"]["top_k_remediations"] == 3
+
 
 # ============================================================================
 # Root Endpoint Tests